@@ -3,8 +3,54 @@ Database module for storing and retrieving API key data.
 """
 
 import sqlite3
-from typing import Optional, List, Tuple
-from datetime import datetime
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, List, Set, Tuple
+
+# Maximum number of rows handed to a single executemany() call
+BATCH_SIZE = 10000
+
+# Connection tuning applied once when the database is opened
+PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-65536",
+    "mmap_size=268435456",
+)
+
+# Hot-path statements, kept as module constants so the connection's
+# statement cache always sees the same SQL text
+_SQL_INSERT_KEY = """
+    INSERT OR IGNORE INTO api_keys (api_key, source_url, file_path, language)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_STATUS = """
+    UPDATE api_keys
+    SET status = ?, last_checked = CURRENT_TIMESTAMP, error_message = ?, quota_remaining = ?
+    WHERE api_key = ?
+"""
+
+_SQL_GET_UNCHECKED = """
+    SELECT id, api_key, source_url FROM api_keys
+    WHERE status = 'unknown'
+"""
+
+_SQL_COUNT_UNCHECKED = """
+    SELECT COUNT(*) FROM api_keys
+    WHERE status = 'unknown'
+"""
+
+_SQL_ADD_SCAN = """
+    INSERT INTO scan_history (keyword, language, page, keys_found)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_LAST_PAGE = """
+    SELECT MAX(page) FROM scan_history
+    WHERE keyword = ? AND language = ?
+"""
 
 
 class Database:
@@ -13,10 +59,39 @@ class Database:
     def __init__(self, db_path: str = "google_places.db"):
         """Initialize database connection and create tables if needed."""
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # Autocommit mode: transactions are opened explicitly via _transaction().
+        # The connection may be shared across threads. WAL only lets readers
+        # run alongside writers on separate connections, so every statement
+        # on this one, reads included, is serialized through _lock.
+        self.conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
+        self._lock = threading.Lock()
+        for pragma in PRAGMAS:
+            self.conn.execute(f"PRAGMA {pragma}")
         self.cursor = self.conn.cursor()
         self._create_tables()
 
+    @contextmanager
+    def _transaction(self):
+        """Run the enclosed statements inside a single, serialized transaction."""
+        with self._lock:
+            self.conn.execute("BEGIN")
+            try:
+                yield
+            except BaseException:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Tuple]:
+        """Run a read query on its own cursor and return all rows."""
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
     def _create_tables(self):
         """Create necessary tables if they don't exist."""
         self.cursor.execute("""
@@ -45,7 +120,17 @@ class Database:
             )
         """)
         
-        self.conn.commit()
+        # Speeds up the MAX(page) lookup in get_last_scan_page
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_scan_kw_lang
+            ON scan_history (keyword, language, page DESC)
+        """)
+        
+        # Speeds up status filters (unchecked/valid keys)
+        self.cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_api_status
+            ON api_keys (status)
+        """)
 
     def add_key(
         self,
@@ -60,16 +145,31 @@ class Database:
         Returns:
             True if key was added, False if it already exists.
         """
-        try:
-            self.cursor.execute("""
-                INSERT INTO api_keys (api_key, source_url, file_path, language)
-                VALUES (?, ?, ?, ?)
-            """, (api_key, source_url, file_path, language))
-            self.conn.commit()
-            return True
-        except sqlite3.IntegrityError:
-            # Key already exists
-            return False
+        with self._lock:
+            self.cursor.execute(_SQL_INSERT_KEY, (api_key, source_url, file_path, language))
+            return self.cursor.rowcount == 1
+
+    def add_keys(self, rows: Iterable[Tuple[str, str, str, str]]) -> int:
+        """
+        Add many API keys to the database in a single transaction.
+        
+        Args:
+            rows: Iterable of (api_key, source_url, file_path, language) tuples
+            
+        Returns:
+            Number of keys that were newly added.
+        """
+        with self._transaction():
+            return self._insert_keys(rows)
+
+    def _insert_keys(self, rows: Iterable[Tuple[str, str, str, str]]) -> int:
+        """Insert keys in batches; the caller must hold an open transaction."""
+        rows = list(rows)
+        added = 0
+        for start in range(0, len(rows), BATCH_SIZE):
+            self.cursor.executemany(_SQL_INSERT_KEY, rows[start:start + BATCH_SIZE])
+            added += self.cursor.rowcount
+        return added
 
     def update_key_status(
         self,
@@ -79,47 +179,78 @@ class Database:
         quota_remaining: int = None
     ):
         """Update the status of an API key after validation."""
-        self.cursor.execute("""
-            UPDATE api_keys
-            SET status = ?, last_checked = ?, error_message = ?, quota_remaining = ?
-            WHERE api_key = ?
-        """, (status, datetime.now(), error_message, quota_remaining, api_key))
-        self.conn.commit()
-
-    def get_unchecked_keys(self) -> List[Tuple]:
-        """Get all keys that haven't been validated yet."""
-        self.cursor.execute("""
-            SELECT id, api_key, source_url FROM api_keys
-            WHERE status = 'unknown'
-        """)
-        return self.cursor.fetchall()
+        with self._lock:
+            self.cursor.execute(
+                _SQL_UPDATE_STATUS,
+                (status, error_message, quota_remaining, api_key)
+            )
+
+    def update_keys_status(self, rows: Iterable[Tuple[str, str, Optional[str]]]):
+        """
+        Update the status of many API keys in a single transaction.
+        
+        Args:
+            rows: Iterable of (api_key, status, error_message) tuples
+        """
+        params = [
+            (status, error_message, None, api_key)
+            for api_key, status, error_message in rows
+        ]
+        with self._transaction():
+            for start in range(0, len(params), BATCH_SIZE):
+                self.cursor.executemany(_SQL_UPDATE_STATUS, params[start:start + BATCH_SIZE])
+
+    def iter_unchecked_keys(self, chunk: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream keys that haven't been validated yet.
+        
+        Rows are fetched `chunk` at a time on a dedicated cursor, so callers
+        may keep writing through this Database while iterating. The lock is
+        held only while each chunk is fetched.
+        """
+        with self._lock:
+            cursor = self.conn.execute(_SQL_GET_UNCHECKED)
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(chunk)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
+    def count_unchecked_keys(self) -> int:
+        """Get the number of keys that haven't been validated yet."""
+        return self._query(_SQL_COUNT_UNCHECKED)[0][0]
 
     def get_all_keys(self) -> List[Tuple]:
         """Get all keys from the database."""
-        self.cursor.execute("""
+        return self._query("""
             SELECT id, api_key, status, source_url, file_path, language,
                    discovered_at, last_checked, error_message
             FROM api_keys
             ORDER BY discovered_at DESC
         """)
-        return self.cursor.fetchall()
 
     def get_valid_keys(self) -> List[Tuple]:
         """Get all valid/working keys."""
-        self.cursor.execute("""
+        return self._query("""
             SELECT id, api_key, source_url FROM api_keys
             WHERE status = 'valid'
         """)
-        return self.cursor.fetchall()
+
+    def existing_keys(self) -> Set[str]:
+        """Get the set of every API key already stored."""
+        return {row[0] for row in self._query("SELECT api_key FROM api_keys")}
 
     def get_key_count(self) -> dict:
         """Get count of keys by status."""
-        self.cursor.execute("""
+        results = self._query("""
             SELECT status, COUNT(*) as count
             FROM api_keys
             GROUP BY status
         """)
-        results = self.cursor.fetchall()
         return {row[0]: row[1] for row in results}
 
     def add_scan_record(
@@ -130,19 +261,35 @@ class Database:
         keys_found: int
     ):
         """Record a scan attempt."""
-        self.cursor.execute("""
-            INSERT INTO scan_history (keyword, language, page, keys_found)
-            VALUES (?, ?, ?, ?)
-        """, (keyword, language, page, keys_found))
-        self.conn.commit()
+        with self._lock:
+            self.cursor.execute(_SQL_ADD_SCAN, (keyword, language, page, keys_found))
+
+    def add_scan_records(
+        self,
+        rows: Iterable[Tuple[str, str, int, int]],
+        keys: Iterable[Tuple[str, str, str, str]] = ()
+    ) -> int:
+        """
+        Record many scan attempts in a single transaction.
+        
+        Keys found on those pages are stored in the same transaction, so
+        scan history is never committed without the keys it covers.
+        
+        Args:
+            rows: Iterable of (keyword, language, page, keys_found) tuples
+            keys: Iterable of (api_key, source_url, file_path, language) tuples
+            
+        Returns:
+            Number of keys that were newly added.
+        """
+        with self._transaction():
+            added = self._insert_keys(keys)
+            self.cursor.executemany(_SQL_ADD_SCAN, rows)
+        return added
 
     def get_last_scan_page(self, keyword: str, language: str) -> Optional[int]:
         """Get the last scanned page for a keyword/language combination."""
-        self.cursor.execute("""
-            SELECT MAX(page) FROM scan_history
-            WHERE keyword = ? AND language = ?
-        """, (keyword, language))
-        result = self.cursor.fetchone()
+        result = self._query(_SQL_LAST_PAGE, (keyword, language))[0]
         return result[0] if result[0] is not None else None
 
     def close(self):
@@ -6,21 +6,50 @@ Scans GitHub for exposed Google Places API Keys.
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 from database import Database
-from scanner import GitHubScanner
+from ratelimit import TokenBucket
+from scanner import GitHubApiScanner, GitHubScanner
 from validator import PlacesAPIValidator
 
 console = Console()
 
+# Key validation concurrency and Places API pacing
+VALIDATION_WORKERS = 8
+VALIDATION_RATE = 2  # requests per second
+VALIDATION_BURST = 4
+
+# HTTP connection pool shared by all validation requests
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+# Number of validated keys written back to the database per batch
+STATUS_BATCH_SIZE = 100
+
+
+def create_http_session() -> requests.Session:
+    """Create a pooled HTTP session with retries for API validation."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount("https://", adapter)
+    return session
+
 
 def print_banner():
     """Print the application banner."""
@@ -104,37 +133,78 @@ def parse_args():
         help="Only scan high-value file types (skip keyword/language search)"
     )
     
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of search combos to scan concurrently"
+    )
+    
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=None,
+        help="Maximum GitHub search requests per second across all workers"
+    )
+    
+    parser.add_argument(
+        "--api",
+        action="store_true",
+        help="Use the GitHub code search API instead of a browser (requires a token)"
+    )
+    
+    parser.add_argument(
+        "--token",
+        type=str,
+        default=os.environ.get("GITHUB_TOKEN"),
+        help="GitHub personal access token for --api (default: $GITHUB_TOKEN)"
+    )
+    
     return parser.parse_args()
 
 
 def validate_keys(db: Database, validator: PlacesAPIValidator):
     """Validate all unchecked keys in the database."""
-    unchecked = db.get_unchecked_keys()
+    total = db.count_unchecked_keys()
     
-    if not unchecked:
+    if not total:
         console.print("[yellow]No unchecked keys found in database.[/yellow]")
         return
     
-    console.print(f"\n[bold]Validating {len(unchecked)} API keys...[/bold]\n")
+    console.print(f"\n[bold]Validating {total} API keys...[/bold]\n")
     
     valid_count = 0
     invalid_count = 0
+    updates = []
     
-    for key_id, api_key, source_url in tqdm(unchecked, desc="Validating keys"):
-        status, error_msg = validator.validate_key(api_key)
-        db.update_key_status(api_key, status, error_msg)
-        
-        if status == "valid":
-            valid_count += 1
-            console.print(f"[bold green]✓ Valid key found: {api_key[:20]}...[/bold green]")
-        else:
-            invalid_count += 1
-            if error_msg:
-                console.print(f"[dim]✗ {api_key[:20]}... - {status}: {error_msg}[/dim]")
-        
-        # Rate limiting for API calls
-        import time
-        time.sleep(0.5)
+    # Rate limiting for API calls, shared by all workers
+    bucket = TokenBucket(rate=VALIDATION_RATE, capacity=VALIDATION_BURST)
+    
+    unchecked = (api_key for key_id, api_key, source_url in db.iter_unchecked_keys())
+    checks = validator.iter_validate(
+        unchecked,
+        max_workers=VALIDATION_WORKERS,
+        limiter=bucket
+    )
+    
+    # Write back whatever was validated even if the run is interrupted
+    try:
+        for api_key, (status, error_msg) in tqdm(checks, total=total, desc="Validating keys"):
+            updates.append((api_key, status, error_msg))
+            
+            if status == "valid":
+                valid_count += 1
+                console.print(f"[bold green]✓ Valid key found: {api_key[:20]}...[/bold green]")
+            else:
+                invalid_count += 1
+                if error_msg:
+                    console.print(f"[dim]✗ {api_key[:20]}... - {status}: {error_msg}[/dim]")
+            
+            if len(updates) >= STATUS_BATCH_SIZE:
+                db.update_keys_status(updates)
+                updates.clear()
+    finally:
+        db.update_keys_status(updates)
     
     console.print(f"\n[bold]Validation complete![/bold]")
     console.print(f"[green]Valid: {valid_count}[/green] | [red]Invalid: {invalid_count}[/red]")
@@ -189,88 +259,114 @@ def main():
     
     # Initialize database
     db = Database(args.db)
-    validator = PlacesAPIValidator()
-    
-    console.print(f"[dim]Database: {args.db}[/dim]\n")
-    
-    # Show current summary
-    display_summary(db)
-    
-    if args.check_existed_keys_only:
-        # Only validate existing keys
-        console.print("\n[bold]Mode: Check existing keys only[/bold]")
-        validate_keys(db, validator)
-        display_valid_keys(db)
-        db.close()
-        return
+    session = create_http_session()
+    validator = PlacesAPIValidator(session=session)
     
-    # Start scanning
     try:
-        scanner = GitHubScanner(headless=args.headless, debug=args.debug)
-        scanner.start()
-        
-        if not scanner.logged_in:
-            console.print("[bold red]Failed to log in to GitHub. Exiting.[/bold red]")
-            scanner.close()
-            db.close()
-            sys.exit(1)
-        
-        results = []
-        new_keys = 0
-        
-        # Perform standard keyword/language search
-        if not args.high_value_only:
-            console.print("\n[bold cyan]Phase 1: Keyword-based search[/bold cyan]")
-            keyword_results = scanner.search(
-                keywords=args.keywords,
-                languages=args.languages,
-                from_iter=args.from_iter,
-                max_pages=args.max_pages
-            )
-            results.extend(keyword_results)
-            console.print(f"[green]Found {len(keyword_results)} keys from keyword search[/green]")
+        console.print(f"[dim]Database: {args.db}[/dim]\n")
         
-        # Perform high-value path-based search
-        if args.high_value or args.high_value_only:
-            console.print("\n[bold cyan]Phase 2: High-value file type search[/bold cyan]")
-            console.print("[dim]Scanning: .bash_history, AndroidManifest.xml, .ipynb, next.config.js, etc.[/dim]\n")
-            path_results = scanner.search_by_path(
-                from_iter=args.from_iter if args.high_value_only else 0,
-                max_pages=args.max_pages
-            )
-            results.extend(path_results)
-            console.print(f"[green]Found {len(path_results)} keys from high-value files[/green]")
+        # Show current summary
+        display_summary(db)
         
-        console.print(f"\n[bold]Total: Found {len(results)} potential API keys[/bold]\n")
+        if args.check_existed_keys_only:
+            # Only validate existing keys
+            console.print("\n[bold]Mode: Check existing keys only[/bold]")
+            validate_keys(db, validator)
+            display_valid_keys(db)
+            db.close()
+            return
         
-        # Add keys to database
-        for api_key, source_url, file_path, language in results:
-            if db.add_key(api_key, source_url, file_path, language):
-                new_keys += 1
+        # Start scanning
+        try:
+            if args.api:
+                if not args.token:
+                    console.print("[bold red]--api requires a GitHub token (--token or GITHUB_TOKEN).[/bold red]")
+                    db.close()
+                    sys.exit(1)
+                scanner = GitHubApiScanner(
+                    token=args.token,
+                    debug=args.debug,
+                    workers=args.workers,
+                    rate=args.rate
+                )
+            else:
+                scanner = GitHubScanner(
+                    headless=args.headless,
+                    debug=args.debug,
+                    workers=args.workers,
+                    rate=args.rate
+                )
+            scanner.start()
+            
+            if not scanner.logged_in:
+                console.print("[bold red]Failed to log in to GitHub. Exiting.[/bold red]")
+                scanner.close()
+                db.close()
+                sys.exit(1)
+            
+            # Skip keys we already have so they are filtered client-side;
+            # the scanner keeps only their digests, not the key strings
+            scanner.remember_keys(db.existing_keys())
+            keys_before = sum(db.get_key_count().values())
+            
+            # Each search stores its keys as every combo finishes, so keys
+            # already found survive an interrupted or failed scan
+            results = []
+            
+            # Perform standard keyword/language search
+            if not args.high_value_only:
+                console.print("\n[bold cyan]Phase 1: Keyword-based search[/bold cyan]")
+                keyword_results = scanner.search(
+                    keywords=args.keywords,
+                    languages=args.languages,
+                    from_iter=args.from_iter,
+                    max_pages=args.max_pages,
+                    db=db
+                )
+                results.extend(keyword_results)
+                console.print(f"[green]Found {len(keyword_results)} keys from keyword search[/green]")
+            
+            # Perform high-value path-based search
+            if args.high_value or args.high_value_only:
+                console.print("\n[bold cyan]Phase 2: High-value file type search[/bold cyan]")
+                console.print("[dim]Scanning: .bash_history, AndroidManifest.xml, .ipynb, next.config.js, etc.[/dim]\n")
+                path_results = scanner.search_by_path(
+                    from_iter=args.from_iter if args.high_value_only else 0,
+                    max_pages=args.max_pages,
+                    db=db
+                )
+                results.extend(path_results)
+                console.print(f"[green]Found {len(path_results)} keys from high-value files[/green]")
+            
+            console.print(f"\n[bold]Total: Found {len(results)} potential API keys[/bold]\n")
+            
+            new_keys = sum(db.get_key_count().values()) - keys_before
+            
+            console.print(f"[green]Added {new_keys} new keys to database[/green]")
+            
+            scanner.close()
+            
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Scan interrupted by user.[/yellow]")
+        except Exception as e:
+            console.print(f"[bold red]Error during scan: {e}[/bold red]")
+            if args.debug:
+                import traceback
+                traceback.print_exc()
         
-        console.print(f"[green]Added {new_keys} new keys to database[/green]")
+        # Validate newly found keys
+        console.print("\n[bold]Validating discovered keys...[/bold]")
+        validate_keys(db, validator)
         
-        scanner.close()
+        # Show final summary
+        console.print("\n")
+        display_summary(db)
+        display_valid_keys(db)
         
-    except KeyboardInterrupt:
-        console.print("\n[yellow]Scan interrupted by user.[/yellow]")
-    except Exception as e:
-        console.print(f"[bold red]Error during scan: {e}[/bold red]")
-        if args.debug:
-            import traceback
-            traceback.print_exc()
-    
-    # Validate newly found keys
-    console.print("\n[bold]Validating discovered keys...[/bold]")
-    validate_keys(db, validator)
-    
-    # Show final summary
-    console.print("\n")
-    display_summary(db)
-    display_valid_keys(db)
-    
-    db.close()
-    console.print("\n[dim]Results saved to database.[/dim]")
+        db.close()
+        console.print("\n[dim]Results saved to database.[/dim]")
+    finally:
+        session.close()
 
 
 if __name__ == "__main__":
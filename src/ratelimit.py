@@ -0,0 +1,57 @@
+"""
+Rate limiting helpers for outbound API calls.
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter."""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens that can accumulate (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Reserve a token up front; a negative balance is the wait owed
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+
+    def defer(self, seconds: float):
+        """
+        Hold off the next token for at least the given number of seconds.
+        
+        Used to honour a server asking us to slow down; a shorter deferral
+        never shortens a longer one already in effect.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            # Leave the balance so the next acquire() owes exactly `seconds`
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
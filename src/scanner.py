@@ -1,39 +1,105 @@
 """
-GitHub scanner using Selenium to search for exposed API keys.
+GitHub scanners (Selenium and REST API) to search for exposed API keys.
 """
 
+import hashlib
+import itertools
+import json
 import re
+import string
+import threading
 import time
-from typing import List, Set, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, List, Set, Tuple, Optional
 from urllib.parse import quote_plus
 
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 
 from rich.console import Console
 
+from database import Database
+from ratelimit import TokenBucket
+
+# Prefer RE2's linear-time DFA engine for scanning large pages when the
+# optional google-re2 package is installed
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
 console = Console()
 
+# Google API keys start with 'AIza' and are 39 characters long.
+# Quoted and assignment forms (key = "AIza...") are supersets of the bare
+# key, so a single pattern captures every case in one pass over the text.
+_KEY_RE = _regex.compile(r'(AIza[0-9A-Za-z\-_]{35})')
+
+# Highlight markup (<mark>...</mark>) in search result snippets, which would
+# otherwise split a key at the searched-for prefix
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Deletes every character allowed after the 'AIza' prefix
+_STRIP_TABLE = str.maketrans("", "", string.ascii_letters + string.digits + "-_")
+
+
+def _rate_limit_delay(response: requests.Response) -> float:
+    """
+    Seconds to hold off before the next request, per GitHub's rate limit headers.
+    
+    Honours Retry-After when present; otherwise spreads the remaining
+    request budget evenly over the time left until the window resets.
+    """
+    headers = response.headers
+    retry_after = headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return 0.0
+    return max(0.0, (int(reset) - time.time()) / max(int(remaining), 1))
+
+
+def _is_throttled(response: requests.Response) -> bool:
+    """Whether a 403/429 was a rate limit rather than e.g. a missing token scope."""
+    headers = response.headers
+    return response.status_code in (403, 429) and (
+        "Retry-After" in headers or headers.get("X-RateLimit-Remaining") == "0"
+    )
+
+
+def _path_file_type(path_pattern: str) -> str:
+    """Label a path pattern by its last component, e.g. 'path:**/.env' -> '.env'."""
+    return path_pattern.split("/")[-1].replace("*", "")
+
+
+def _key_digest(key: str) -> int:
+    """64-bit digest of a key, stored in place of the key to keep found_keys small."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def _is_valid_key(key: str) -> bool:
+    """Check that a candidate is exactly 'AIza' followed by 35 key characters."""
+    # str.translate removes every allowed character in C; anything left over
+    # is invalid. Working on the str directly avoids encoding each candidate.
+    return (
+        len(key) == 39
+        and key.startswith("AIza")
+        and not key[4:].translate(_STRIP_TABLE)
+    )
+
 
 class GitHubScanner:
     """Scans GitHub for exposed Google Places API keys."""
 
-    # Google API key patterns
-    # Google API keys typically start with 'AIza' and are 39 characters long
-    API_KEY_PATTERNS = [
-        # Standard Google API key pattern
-        r'AIza[0-9A-Za-z\-_]{35}',
-        # Quoted API keys
-        r'["\']AIza[0-9A-Za-z\-_]{35}["\']',
-        # Assignment patterns
-        r'(?:api_key|apikey|key|google_api_key|maps_api_key|places_api_key)\s*[=:]\s*["\']?(AIza[0-9A-Za-z\-_]{35})["\']?',
-    ]
-
     # Default search keywords - Standard patterns
     DEFAULT_KEYWORDS = [
         "GOOGLE_PLACES_API_KEY",
@@ -81,6 +147,24 @@ class GitHubScanner:
         "path:**/Dockerfile",
     ]
 
+    # File type label for each high-value path, computed once
+    _PATH_TO_FILETYPE = {p: _path_file_type(p) for p in HIGH_VALUE_PATHS}
+
+    # Browser identity, shared by Chrome and the HTTP session used for search
+    USER_AGENT = (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+
+    # Default cap on aggregate search requests per second across all workers
+    REQUEST_RATE = 1 / 3
+
+    # Resume keyword searches from scan_history and record scanned pages there
+    SCAN_HISTORY = True
+
+    # Seconds to wait after a failed page
+    ERROR_DELAY = 5
+
     # Programming languages to search
     DEFAULT_LANGUAGES = [
         "python",
@@ -98,19 +182,34 @@ class GitHubScanner:
         "c#",
     ]
 
-    def __init__(self, headless: bool = False, debug: bool = False):
+    def __init__(
+        self,
+        headless: bool = False,
+        debug: bool = False,
+        workers: int = 4,
+        rate: Optional[float] = None
+    ):
         """
         Initialize the GitHub scanner.
         
         Args:
             headless: Run browser in headless mode (no GUI)
             debug: Enable debug output
+            workers: Number of search combos scanned concurrently
+            rate: Maximum search requests per second (uses REQUEST_RATE if None)
         """
         self.debug = debug
         self.headless = headless
+        self.workers = workers
         self.driver = None
+        self.session = None
         self.logged_in = False
-        self.found_keys: Set[str] = set()
+        # Digests (see _key_digest) of every key seen this session
+        self.found_keys: Set[int] = set()
+        self._keys_lock = threading.Lock()
+        # Set when the caller stops consuming results; combos check it per page
+        self._stop = threading.Event()
+        self._limiter = TokenBucket(rate=rate or self.REQUEST_RATE, capacity=1)
 
     def _setup_driver(self):
         """Set up the Chrome WebDriver."""
@@ -128,10 +227,7 @@ class GitHubScanner:
         options.add_experimental_option("useAutomationExtension", False)
         
         # Add user agent to avoid detection
-        options.add_argument(
-            "user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        options.add_argument(f"user-agent={self.USER_AGENT}")
         
         self.driver = webdriver.Chrome(options=options)
         
@@ -163,23 +259,82 @@ class GitHubScanner:
         
         # Verify login
         self.driver.get("https://github.com")
-        time.sleep(2)
         
         try:
-            # Check for user avatar or profile menu
-            self.driver.find_element(By.CSS_SELECTOR, "img.avatar")
+            # Wait for the user avatar to render instead of sleeping a fixed time
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "img.avatar"))
+            )
             self.logged_in = True
             console.print("[bold green]✓ Successfully logged in to GitHub[/bold green]\n")
-        except NoSuchElementException:
+        except TimeoutException:
             console.print("[bold red]✗ Login verification failed. Please try again.[/bold red]")
             self.logged_in = False
+            return
+        
+        # Search pages are fetched over HTTP; the browser is only needed to log in
+        self._init_session()
+        self.driver.quit()
+        self.driver = None
+
+    def _init_session(self):
+        """Copy the browser's GitHub cookies into an HTTP session for searching."""
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = self.USER_AGENT
+        # The results list on github.com/search is rendered by JavaScript, so
+        # the plain HTML has none of it; ask for the JSON data it's built from
+        self.session.headers["Accept"] = "application/json"
+        
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain"),
+                path=cookie.get("path", "/")
+            )
+
+    def _fetch(self, url: str) -> str:
+        """Fetch a GitHub search page as JSON with the logged-in HTTP session."""
+        if self.debug:
+            console.print(f"[dim]Fetching: {url}[/dim]")
+        
+        response = self.session.get(url, timeout=30)
+        self._respect_rate_limit(response)
+        response.raise_for_status()
+        
+        # A logged-out session is redirected to the HTML login page; fail the
+        # page rather than let it pass for an empty result list
+        content_type = response.headers.get("Content-Type", "")
+        if "json" not in content_type:
+            raise ValueError(
+                f"Expected JSON search results, got '{content_type or 'no content type'}' "
+                "(has the GitHub session expired?)"
+            )
+        return response.text
+
+    def _respect_rate_limit(self, response: requests.Response) -> float:
+        """
+        Defer the shared limiter by as much as GitHub's headers ask for.
+        
+        Returns:
+            The delay applied, in seconds (0 if none was needed)
+        """
+        delay = _rate_limit_delay(response)
+        if delay > 0:
+            self._limiter.defer(delay)
+            if _is_throttled(response):
+                console.print(
+                    f"[yellow]GitHub rate limit reached, waiting {delay:.0f}s...[/yellow]"
+                )
+        return delay
 
     def search(
         self,
         keywords: List[str] = None,
         languages: List[str] = None,
         from_iter: int = 0,
-        max_pages: int = 5
+        max_pages: int = 5,
+        db: Optional[Database] = None
     ) -> List[Tuple[str, str, str, str]]:
         """
         Search GitHub for API keys.
@@ -189,6 +344,8 @@ class GitHubScanner:
             languages: Programming languages to filter (uses defaults if None)
             from_iter: Start from specific iteration
             max_pages: Maximum pages to scan per keyword/language combo
+            db: Database used to resume from scan_history, store each combo's
+                keys and record its scanned pages (optional)
             
         Returns:
             List of tuples: (api_key, source_url, file_path, language)
@@ -200,48 +357,110 @@ class GitHubScanner:
         keywords = keywords or self.DEFAULT_KEYWORDS
         languages = languages or self.DEFAULT_LANGUAGES
         
-        results = []
-        iteration = 0
-        
         total_iterations = len(keywords) * len(languages) * max_pages
         console.print(f"[bold]Total iterations to scan: {total_iterations}[/bold]\n")
         
-        for keyword in keywords:
-            for language in languages:
-                for page in range(1, max_pages + 1):
-                    iteration += 1
-                    
-                    if iteration < from_iter:
-                        continue
-                    
-                    console.print(
-                        f"[cyan]Iteration {iteration}/{total_iterations}[/cyan] - "
-                        f"Keyword: '{keyword}', Language: {language}, Page: {page}"
-                    )
-                    
-                    try:
-                        page_results = self._search_page(keyword, language, page)
-                        results.extend(page_results)
-                        
-                        if len(page_results) == 0:
-                            if self.debug:
-                                console.print("[dim]No results on this page, moving to next combo[/dim]")
-                            break
-                        
-                        # Rate limiting - be nice to GitHub
-                        time.sleep(3)
-                        
-                    except Exception as e:
-                        console.print(f"[red]Error during search: {e}[/red]")
-                        time.sleep(5)
+        # Plan each keyword/language combo, resuming after the last page
+        # already recorded for it
+        combos = []
+        for combo, (keyword, language) in enumerate(itertools.product(keywords, languages)):
+            start_page = 1
+            if db is not None and self.SCAN_HISTORY:
+                start_page = (db.get_last_scan_page(keyword, language) or 0) + 1
+                if start_page > max_pages:
+                    if self.debug:
+                        console.print(
+                            f"[dim]Already scanned '{keyword}' ({language}), skipping[/dim]"
+                        )
+                    continue
+            
+            combos.append((
+                keyword, language, start_page, max_pages,
+                combo * max_pages, from_iter, total_iterations
+            ))
+        
+        results = []
+        for combo_results, scanned_pages in self._run_concurrently(self._search_combo, combos):
+            results.extend(combo_results)
+            
+            # Commit the keys and the pages they came from together, so a
+            # run that is cut short never resumes past unsaved keys
+            if db is not None and self.SCAN_HISTORY:
+                db.add_scan_records(scanned_pages, keys=combo_results)
+            elif db is not None:
+                db.add_keys(combo_results)
         
         return results
 
+    def _search_combo(
+        self,
+        keyword: str,
+        language: str,
+        start_page: int,
+        max_pages: int,
+        base_iteration: int,
+        from_iter: int,
+        total_iterations: int
+    ) -> Tuple[List[Tuple[str, str, str, str]], List[Tuple[str, str, int, int]]]:
+        """
+        Scan the result pages of one keyword/language combo in order.
+        
+        Returns:
+            Tuple of (results, scanned pages as scan_history rows)
+        """
+        results = []
+        scanned_pages = []
+        
+        # Encode the query once for every page of this combo
+        query = self._prepare_query(f"{keyword} language:{language}")
+        
+        for page in range(start_page, max_pages + 1):
+            iteration = base_iteration + page
+            
+            if iteration < from_iter:
+                continue
+            
+            if self._stop.is_set():
+                break
+            
+            console.print(
+                f"[cyan]Iteration {iteration}/{total_iterations}[/cyan] - "
+                f"Keyword: '{keyword}', Language: {language}, Page: {page}"
+            )
+            
+            try:
+                # Rate limiting - be nice to GitHub
+                self._limiter.acquire()
+                if self._stop.is_set():
+                    break
+                
+                page_results, item_count = self._search_page(query, language, page)
+                results.extend(page_results)
+                
+                scanned_pages.append((keyword, language, page, item_count))
+                
+                # Decide on the page's results, not its new keys: keys already
+                # in the database are filtered out, yet later pages may hold more
+                if item_count == 0:
+                    if self.debug:
+                        console.print("[dim]No results on this page, moving to next combo[/dim]")
+                    break
+                
+            except Exception as e:
+                console.print(f"[red]Error during search: {e}[/red]")
+                self._limiter.defer(self.ERROR_DELAY)
+                # Resume starts after the highest recorded page, so stop here
+                # rather than record later pages and never retry this one
+                break
+        
+        return results, scanned_pages
+
     def search_by_path(
         self,
         path_patterns: List[str] = None,
         from_iter: int = 0,
-        max_pages: int = 3
+        max_pages: int = 3,
+        db: Optional[Database] = None
     ) -> List[Tuple[str, str, str, str]]:
         """
         Search GitHub for API keys in specific file types using path patterns.
@@ -253,6 +472,7 @@ class GitHubScanner:
             path_patterns: File path patterns to search (uses HIGH_VALUE_PATHS if None)
             from_iter: Start from specific iteration
             max_pages: Maximum pages to scan per path pattern
+            db: Database to store each pattern's keys in as it finishes (optional)
             
         Returns:
             List of tuples: (api_key, source_url, file_path, file_type)
@@ -263,254 +483,246 @@ class GitHubScanner:
         
         path_patterns = path_patterns or self.HIGH_VALUE_PATHS
         
-        results = []
-        iteration = 0
-        
         total_iterations = len(path_patterns) * max_pages
         console.print(f"[bold]Scanning {len(path_patterns)} high-value file patterns[/bold]")
         console.print(f"[bold]Total iterations: {total_iterations}[/bold]\n")
         
-        for path_pattern in path_patterns:
-            for page in range(1, max_pages + 1):
-                iteration += 1
-                
-                if iteration < from_iter:
-                    continue
-                
-                # Extract file type from pattern for display
-                file_type = path_pattern.split("/")[-1].replace("*", "")
-                
-                console.print(
-                    f"[cyan]Iteration {iteration}/{total_iterations}[/cyan] - "
-                    f"Pattern: '{file_type}', Page: {page}"
-                )
-                
-                try:
-                    page_results = self._search_path_page(path_pattern, page)
-                    results.extend(page_results)
-                    
-                    if len(page_results) == 0:
-                        if self.debug:
-                            console.print("[dim]No results on this page, moving to next pattern[/dim]")
-                        break
-                    
-                    # Rate limiting
-                    time.sleep(3)
-                    
-                except Exception as e:
-                    console.print(f"[red]Error during path search: {e}[/red]")
-                    time.sleep(5)
+        tasks = [
+            (path_pattern, max_pages, index * max_pages, from_iter, total_iterations)
+            for index, path_pattern in enumerate(path_patterns)
+        ]
+        
+        results = []
+        for pattern_results in self._run_concurrently(self._search_path_combo, tasks):
+            results.extend(pattern_results)
+            
+            if db is not None:
+                db.add_keys(pattern_results)
         
         return results
 
-    def _search_path_page(
+    def _search_path_combo(
         self,
         path_pattern: str,
-        page: int
+        max_pages: int,
+        base_iteration: int,
+        from_iter: int,
+        total_iterations: int
     ) -> List[Tuple[str, str, str, str]]:
         """
-        Search a single page of GitHub results for a specific path pattern.
+        Scan the result pages of one path pattern in order.
         
         Returns:
             List of tuples: (api_key, source_url, file_path, file_type)
         """
         results = []
         
-        # Build search URL with path qualifier
-        encoded_pattern = quote_plus(f"AIzaSy {path_pattern}")
-        search_url = f"https://github.com/search?q={encoded_pattern}&type=code&p={page}"
+        # File type for display and for each key found
+        file_type = (
+            self._PATH_TO_FILETYPE.get(path_pattern) or _path_file_type(path_pattern)
+        )
+        query = self._prepare_query(f"AIzaSy {self._path_qualifier(path_pattern)}")
         
-        if self.debug:
-            console.print(f"[dim]Navigating to: {search_url}[/dim]")
+        for page in range(1, max_pages + 1):
+            iteration = base_iteration + page
+            
+            if iteration < from_iter:
+                continue
+            
+            if self._stop.is_set():
+                break
+            
+            console.print(
+                f"[cyan]Iteration {iteration}/{total_iterations}[/cyan] - "
+                f"Pattern: '{file_type}', Page: {page}"
+            )
+            
+            try:
+                # Rate limiting
+                self._limiter.acquire()
+                if self._stop.is_set():
+                    break
+                
+                page_results, item_count = self._search_path_page(query, file_type, page)
+                results.extend(page_results)
+                
+                if item_count == 0:
+                    if self.debug:
+                        console.print("[dim]No results on this page, moving to next pattern[/dim]")
+                    break
+                
+            except Exception as e:
+                console.print(f"[red]Error during path search: {e}[/red]")
+                self._limiter.defer(self.ERROR_DELAY)
         
-        self.driver.get(search_url)
+        return results
+
+    def _run_concurrently(self, func: Callable, tasks: List[tuple]) -> Iterator:
+        """
+        Run func(*task) for each task on a pool of worker threads.
         
-        # Wait for results to load
+        Yields each task's return value as it completes.
+        """
+        self._stop.clear()
+        executor = ThreadPoolExecutor(max_workers=self.workers)
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='results-list']"))
-            )
-        except TimeoutException:
-            if self.debug:
-                console.print("[dim]Timeout waiting for results[/dim]")
+            futures = [executor.submit(func, *task) for task in tasks]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # If the caller bails out (e.g. Ctrl-C), drop queued tasks and let
+            # running ones stop at their next page instead of waiting on them
+            self._stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _extract_new_keys(self, text: str) -> List[str]:
+        """
+        Extract API keys from text that haven't been seen yet.
+        
+        Newly found keys are recorded in found_keys so each key is
+        reported only once per session.
+        """
+        # Every key contains the literal prefix; a substring test rejects
+        # key-free text much faster than running the regex over it
+        if "AIza" not in text:
             return []
+        return self._remember_new_keys({m.group(1) for m in _KEY_RE.finditer(text)})
+
+    def _extract_result_keys(
+        self,
+        page_source: str
+    ) -> Tuple[List[Tuple[str, str, str]], int]:
+        """
+        Extract new keys from a JSON search results page.
         
-        time.sleep(2)
+        The page's payload.results list holds one entry per matching file,
+        with repo_nwo, path, commit_sha/ref_name and snippets[].lines[] of
+        highlighted HTML. Keys are scanned per file so each can be
+        attributed to the file it came from.
+        
+        Returns:
+            Tuple of (list of (api_key, file_url, file_path) tuples,
+            number of results on the page)
+        """
+        found = []
+        
+        # Fail loudly if the response doesn't have the expected shape, so a
+        # format change can't pass for pages with no results
+        data = json.loads(page_source)
+        payload = data.get("payload") if isinstance(data, dict) else None
+        if not isinstance(payload, dict) or not isinstance(payload.get("results"), list):
+            raise ValueError("Unexpected search response: no payload.results list")
+        
+        for item in payload["results"]:
+            try:
+                file_path = item["path"]
+                ref = item.get("commit_sha") or item["ref_name"]
+                file_url = f"https://github.com/{item['repo_nwo']}/blob/{ref}/{file_path}"
+                lines = [
+                    line
+                    for snippet in item["snippets"]
+                    for line in snippet["lines"]
+                ]
+            except (AttributeError, KeyError, TypeError) as e:
+                raise ValueError(f"Unexpected search result format: {e!r}") from e
+            
+            text = _TAG_RE.sub("", "\n".join(lines))
+            
+            for key in self._extract_new_keys(text):
+                found.append((key, file_url, file_path))
         
-        # Extract file type from pattern
-        file_type = path_pattern.split("/")[-1].replace("*", "")
+        return found, len(payload["results"])
+
+    def remember_keys(self, keys: Iterable[str]):
+        """Mark keys as already seen so searches won't report them again."""
+        digests = [_key_digest(key) for key in keys]
+        with self._keys_lock:
+            self.found_keys.update(digests)
+
+    def _remember_new_keys(self, candidates: Set[str]) -> List[str]:
+        """Filter candidate keys down to valid ones that haven't been seen yet."""
+        by_digest = {_key_digest(key): key for key in candidates if _is_valid_key(key)}
+        # Set difference and union run in C instead of a per-key Python loop
+        with self._keys_lock:
+            new_digests = by_digest.keys() - self.found_keys
+            self.found_keys |= new_digests
+        return [by_digest[digest] for digest in new_digests]
+
+    def _path_qualifier(self, path_pattern: str) -> str:
+        """Search qualifier restricting results to a path pattern."""
+        return path_pattern
+
+    def _prepare_query(self, query: str) -> str:
+        """Turn a code search query into the form the page methods take."""
+        return f"https://github.com/search?q={quote_plus(query)}&type=code"
+
+    def _search_path_page(
+        self,
+        query: str,
+        file_type: str,
+        page: int
+    ) -> Tuple[List[Tuple[str, str, str, str]], int]:
+        """
+        Search a single page of GitHub results for a specific path pattern.
         
-        # Get page source and extract keys
-        page_source = self.driver.page_source
+        Args:
+            query: Search URL from _prepare_query, without the page number
+            
+        Returns:
+            Tuple of (list of (api_key, source_url, file_path, file_type)
+            tuples, number of results on the page)
+        """
+        results = []
+        search_url = f"{query}&p={page}"
         
-        for pattern in self.API_KEY_PATTERNS:
-            matches = re.findall(pattern, page_source, re.IGNORECASE)
-            for match in matches:
-                key = match.strip("'\"")
-                if re.match(r'^AIza[0-9A-Za-z\-_]{35}$', key):
-                    if key not in self.found_keys:
-                        self.found_keys.add(key)
-                        results.append((key, search_url, path_pattern, file_type))
-                        console.print(
-                            f"[bold green]Found key in {file_type}: "
-                            f"{key[:20]}...[/bold green]"
-                        )
+        page_source = self._fetch(search_url)
         
-        # Try to get more specific file paths from result items
-        try:
-            result_items = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "[data-testid='results-list'] > div"
+        found, item_count = self._extract_result_keys(page_source)
+        for key, file_url, file_path in found:
+            results.append((key, file_url, file_path, file_type))
+            console.print(
+                f"[bold green]Found key in {file_type}: "
+                f"{key[:20]}...[/bold green]"
             )
-            
-            for item in result_items:
-                try:
-                    file_link = item.find_element(By.CSS_SELECTOR, "a[href*='/blob/']")
-                    file_url = file_link.get_attribute("href")
-                    file_path = file_link.text
-                    code_text = item.text
-                    
-                    for pattern in self.API_KEY_PATTERNS:
-                        matches = re.findall(pattern, code_text, re.IGNORECASE)
-                        for match in matches:
-                            key = match.strip("'\"")
-                            if re.match(r'^AIza[0-9A-Za-z\-_]{35}$', key):
-                                if key not in self.found_keys:
-                                    self.found_keys.add(key)
-                                    results.append((key, file_url, file_path, file_type))
-                                    console.print(
-                                        f"[bold green]Found key: {key[:20]}... "
-                                        f"in {file_path}[/bold green]"
-                                    )
-                except NoSuchElementException:
-                    continue
-        except Exception as e:
-            if self.debug:
-                console.print(f"[red]Error extracting path results: {e}[/red]")
         
-        return results
+        return results, item_count
 
     def _search_page(
         self,
-        keyword: str,
+        query: str,
         language: str,
         page: int
-    ) -> List[Tuple[str, str, str, str]]:
+    ) -> Tuple[List[Tuple[str, str, str, str]], int]:
         """
         Search a single page of GitHub results.
         
+        Args:
+            query: Search URL from _prepare_query, without the page number
+            
         Returns:
-            List of tuples: (api_key, source_url, file_path, language)
+            Tuple of (list of (api_key, source_url, file_path, language)
+            tuples, number of results on the page)
         """
         results = []
+        search_url = f"{query}&p={page}"
         
-        # Build search URL
-        # Using GitHub code search with regex support
-        encoded_keyword = quote_plus(keyword)
-        search_url = (
-            f"https://github.com/search?q={encoded_keyword}"
-            f"+language%3A{language}&type=code&p={page}"
-        )
+        page_source = self._fetch(search_url)
         
-        if self.debug:
-            console.print(f"[dim]Navigating to: {search_url}[/dim]")
-        
-        self.driver.get(search_url)
-        
-        # Wait for results to load
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[data-testid='results-list']"))
-            )
-        except TimeoutException:
-            # No results or page didn't load
-            if self.debug:
-                console.print("[dim]Timeout waiting for results[/dim]")
-            return []
-        
-        time.sleep(2)  # Additional wait for dynamic content
-        
-        # Get all code snippets
-        try:
-            code_elements = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "[data-testid='results-list'] .code-list .f4"
-            )
-            
-            # Fallback to other selectors if the above doesn't work
-            if not code_elements:
-                code_elements = self.driver.find_elements(
-                    By.CSS_SELECTOR,
-                    ".code-list td.blob-code"
-                )
-            
-            if not code_elements:
-                # Try another common structure
-                code_elements = self.driver.find_elements(
-                    By.CSS_SELECTOR,
-                    "[data-hovercard-type='repository'] + div pre"
-                )
-            
-            # Also get the page source for regex matching
-            page_source = self.driver.page_source
-            
-            # Extract API keys using regex patterns
-            for pattern in self.API_KEY_PATTERNS:
-                matches = re.findall(pattern, page_source, re.IGNORECASE)
-                for match in matches:
-                    # Clean up the key (remove quotes if present)
-                    key = match.strip("'\"")
-                    
-                    # Ensure it matches the standard format
-                    if re.match(r'^AIza[0-9A-Za-z\-_]{35}$', key):
-                        if key not in self.found_keys:
-                            self.found_keys.add(key)
-                            results.append((key, search_url, "", language))
-                            console.print(f"[bold green]Found key: {key[:20]}...[/bold green]")
-            
-            # Also try to get file paths from result items
-            result_items = self.driver.find_elements(
-                By.CSS_SELECTOR,
-                "[data-testid='results-list'] > div"
-            )
-            
-            for item in result_items:
-                try:
-                    # Get file path link
-                    file_link = item.find_element(By.CSS_SELECTOR, "a[href*='/blob/']")
-                    file_url = file_link.get_attribute("href")
-                    file_path = file_link.text
-                    
-                    # Get code snippet
-                    code_text = item.text
-                    
-                    # Search for API keys in this snippet
-                    for pattern in self.API_KEY_PATTERNS:
-                        matches = re.findall(pattern, code_text, re.IGNORECASE)
-                        for match in matches:
-                            key = match.strip("'\"")
-                            if re.match(r'^AIza[0-9A-Za-z\-_]{35}$', key):
-                                if key not in self.found_keys:
-                                    self.found_keys.add(key)
-                                    results.append((key, file_url, file_path, language))
-                                    console.print(
-                                        f"[bold green]Found key: {key[:20]}... "
-                                        f"in {file_path}[/bold green]"
-                                    )
-                except NoSuchElementException:
-                    continue
-                    
-        except Exception as e:
-            if self.debug:
-                console.print(f"[red]Error extracting results: {e}[/red]")
+        found, item_count = self._extract_result_keys(page_source)
+        for key, file_url, file_path in found:
+            results.append((key, file_url, file_path, language))
+            console.print(f"[bold green]Found key: {key[:20]}...[/bold green]")
         
-        return results
+        return results, item_count
 
     def close(self):
-        """Close the browser."""
+        """Close the browser and HTTP session."""
         if self.driver:
             self.driver.quit()
             self.driver = None
+        if self.session:
+            self.session.close()
+            self.session = None
 
     def __enter__(self):
         self.start()
@@ -518,3 +730,165 @@ class GitHubScanner:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class GitHubApiScanner(GitHubScanner):
+    """Scans GitHub for exposed API keys using the REST code search API."""
+
+    API_URL = "https://api.github.com"
+
+    # Maximum page size allowed by the code search API
+    PER_PAGE = 100
+
+    # Code search allows 10 authenticated requests per minute; the
+    # X-RateLimit-* response headers are honoured on top of this
+    REQUEST_RATE = 10 / 60
+
+    # API pages hold PER_PAGE results, so page numbers recorded by the web
+    # scanner in scan_history don't line up with these; don't resume from them
+    SCAN_HISTORY = False
+
+    def __init__(
+        self,
+        token: str,
+        debug: bool = False,
+        workers: int = 4,
+        rate: Optional[float] = None
+    ):
+        """
+        Initialize the GitHub API scanner.
+        
+        Args:
+            token: GitHub personal access token (code search requires auth)
+            debug: Enable debug output
+            workers: Number of search combos scanned concurrently
+            rate: Maximum search requests per second (uses REQUEST_RATE if None)
+        """
+        super().__init__(headless=True, debug=debug, workers=workers, rate=rate)
+        self.token = token
+
+    def start(self):
+        """Open an authenticated API session and verify the token."""
+        console.print("[bold blue]Starting GitHub API Scanner...[/bold blue]")
+        
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"token {self.token}",
+            # Include matched code fragments in search results
+            "Accept": "application/vnd.github.text-match+json",
+        })
+        
+        try:
+            response = self.session.get(f"{self.API_URL}/user", timeout=10)
+        except requests.exceptions.RequestException as e:
+            console.print(f"[bold red]✗ Could not reach the GitHub API: {e}[/bold red]")
+            return
+        
+        if response.status_code == 200:
+            self.logged_in = True
+            login = response.json().get("login", "unknown")
+            console.print(f"[bold green]✓ Authenticated to GitHub API as {login}[/bold green]\n")
+        else:
+            console.print(
+                f"[bold red]✗ GitHub API authentication failed "
+                f"(HTTP {response.status_code}).[/bold red]"
+            )
+
+    def _path_qualifier(self, path_pattern: str) -> str:
+        """
+        Translate a web search path pattern into the REST API's legacy syntax.
+        
+        The API doesn't support globs in path:, so match on the pattern's
+        last component instead: 'path:**/*.ipynb' becomes 'extension:ipynb'
+        and 'path:**/.env' becomes 'filename:.env'.
+        """
+        name = path_pattern.split("/")[-1]
+        if name.startswith("*."):
+            return f"extension:{name[2:]}"
+        return f"filename:{name.replace('*', '')}"
+
+    def _prepare_query(self, query: str) -> str:
+        """The API takes the raw query; requests encodes it with the params."""
+        return query
+
+    def _search_page(
+        self,
+        query: str,
+        language: str,
+        page: int
+    ) -> Tuple[List[Tuple[str, str, str, str]], int]:
+        """
+        Search a single page of GitHub API results.
+        
+        Returns:
+            Tuple of (list of (api_key, source_url, file_path, language)
+            tuples, number of results on the page)
+        """
+        return self._search_code(query, page, language)
+
+    def _search_path_page(
+        self,
+        query: str,
+        file_type: str,
+        page: int
+    ) -> Tuple[List[Tuple[str, str, str, str]], int]:
+        """
+        Search a single page of GitHub API results for a specific path pattern.
+        
+        Returns:
+            Tuple of (list of (api_key, source_url, file_path, file_type)
+            tuples, number of results on the page)
+        """
+        return self._search_code(query, page, file_type)
+
+    def _search_code(
+        self,
+        query: str,
+        page: int,
+        tag: str
+    ) -> Tuple[List[Tuple[str, str, str, str]], int]:
+        """
+        Run one code search request and extract keys from the text matches.
+        
+        Args:
+            query: GitHub code search query
+            page: Result page number
+            tag: Language or file type recorded with each key
+            
+        Returns:
+            Tuple of (list of (api_key, source_url, file_path, tag) tuples,
+            number of results on the page)
+        """
+        results = []
+        params = {"q": query, "page": page, "per_page": self.PER_PAGE}
+        
+        if self.debug:
+            console.print(f"[dim]Querying code search: {query} (page {page})[/dim]")
+        
+        url = f"{self.API_URL}/search/code"
+        response = self.session.get(url, params=params, timeout=30)
+        
+        # Retry once if we were throttled; the limiter now holds off until
+        # GitHub's wait is over
+        self._respect_rate_limit(response)
+        if _is_throttled(response):
+            self._limiter.acquire()
+            response = self.session.get(url, params=params, timeout=30)
+            self._respect_rate_limit(response)
+        
+        response.raise_for_status()
+        
+        items = response.json().get("items", [])
+        for item in items:
+            file_url = item.get("html_url", "")
+            file_path = item.get("path", "")
+            
+            for text_match in item.get("text_matches", []):
+                for key in self._extract_new_keys(text_match.get("fragment", "")):
+                    results.append((key, file_url, file_path, tag))
+                    console.print(
+                        f"[bold green]Found key: {key[:20]}... "
+                        f"in {file_path}[/bold green]"
+                    )
+        
+        return results, len(items)
@@ -2,8 +2,17 @@
 API Key validator for Google Places API.
 """
 
+import itertools
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
 import requests
-from typing import Tuple
+
+from ratelimit import TokenBucket
+
+# REQUEST_DENIED messages that mean the key works but is restricted
+_RESTRICTED_RE = re.compile(r"not authorized|api key.*restricted", re.IGNORECASE)
 
 
 class PlacesAPIValidator:
@@ -14,9 +23,30 @@ class PlacesAPIValidator:
     PLACES_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
     GEOCODING_URL = "https://maps.googleapis.com/maps/api/geocode/json"
 
-    def __init__(self):
-        """Initialize the validator."""
-        pass
+    # Message returned when a key only proved valid through the Geocoding fallback
+    GEOCODING_OK_MESSAGE = "Works with Geocoding API"
+
+    # Phrases in a REQUEST_DENIED message and what they say about the key.
+    # Only 'api_not_enabled' leaves other APIs such as Geocoding in question.
+    DENIAL_HINTS = (
+        ("api key is invalid", "invalid_key"),
+        ("referer restriction", "referer_restricted"),
+        ("ip address", "ip_restricted"),
+        ("billing", "billing_disabled"),
+        ("not authorized to use this api", "api_not_enabled"),
+        ("has not been used", "api_not_enabled"),
+        ("not enabled", "api_not_enabled"),
+    )
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize the validator.
+        
+        Args:
+            session: HTTP session to reuse across requests (a new one is
+                created if None)
+        """
+        self.session = session or requests.Session()
 
     def validate_key(self, api_key: str) -> Tuple[str, str]:
         """
@@ -29,6 +59,75 @@ class PlacesAPIValidator:
             Tuple of (status, error_message)
             Status can be: 'valid', 'invalid', 'rate_limited', 'restricted', 'error'
         """
+        result = self._check_places(api_key)
+        if result is None:
+            # Try geocoding as fallback to check if key works for other APIs
+            result = self._try_geocoding(api_key)
+        return result
+
+    def iter_validate(
+        self,
+        keys: Iterable[str],
+        max_workers: int = 32,
+        limiter: Optional[TokenBucket] = None
+    ) -> Iterator[Tuple[str, Tuple[str, str]]]:
+        """
+        Validate many API keys concurrently over the shared session.
+        
+        Args:
+            keys: API keys to validate
+            max_workers: Number of concurrent validation requests
+            limiter: Optional rate limiter acquired before each validation
+            
+        Yields:
+            (api_key, (status, error_message)) as each validation completes
+        """
+        def check(api_key):
+            if limiter is not None:
+                limiter.acquire()
+            return self.validate_key(api_key)
+        
+        keys = iter(keys)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            # Keep only a bounded window of keys in flight, pulling the next
+            # one as each check finishes, so the key source is streamed
+            pending = {
+                executor.submit(check, api_key): api_key
+                for api_key in itertools.islice(keys, 2 * max_workers)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    api_key = pending.pop(future)
+                    for next_key in itertools.islice(keys, 1):
+                        pending[executor.submit(check, next_key)] = next_key
+                    yield api_key, future.result()
+        finally:
+            # Don't start queued validations if the caller stops early
+            executor.shutdown(cancel_futures=True)
+
+    def validate_many(
+        self,
+        keys: Iterable[str],
+        max_workers: int = 32,
+        limiter: Optional[TokenBucket] = None
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Validate many API keys concurrently.
+        
+        Returns:
+            Dict mapping each API key to its (status, error_message)
+        """
+        return dict(self.iter_validate(keys, max_workers, limiter))
+
+    def _check_places(self, api_key: str) -> Optional[Tuple[str, str]]:
+        """
+        Validate a key against the Places Nearby Search endpoint.
+        
+        Returns None when the response says nothing about the key
+        (INVALID_REQUEST), so the caller can fall back to Geocoding.
+        """
         try:
             # Try Places API Nearby Search with a known location (New York City)
             params = {
@@ -38,7 +137,7 @@ class PlacesAPIValidator:
                 "type": "restaurant"
             }
             
-            response = requests.get(
+            response = self.session.get(
                 self.PLACES_NEARBY_URL,
                 params=params,
                 timeout=10
@@ -55,9 +154,7 @@ class PlacesAPIValidator:
                 error_msg = data.get("error_message", "Request denied")
                 
                 # Check if it's a restriction issue
-                if "API key" in error_msg.lower() and "restricted" in error_msg.lower():
-                    return ("restricted", error_msg)
-                elif "not authorized" in error_msg.lower():
+                if _RESTRICTED_RE.search(error_msg):
                     return ("restricted", error_msg)
                 else:
                     return ("invalid", error_msg)
@@ -66,8 +163,7 @@ class PlacesAPIValidator:
                 return ("rate_limited", "Over query limit")
             
             elif status == "INVALID_REQUEST":
-                # Try geocoding as fallback to check if key works for other APIs
-                return self._try_geocoding(api_key)
+                return None
             
             else:
                 return ("error", f"Unknown status: {status}")
@@ -92,7 +188,7 @@ class PlacesAPIValidator:
                 "address": "1600 Amphitheatre Parkway, Mountain View, CA"
             }
             
-            response = requests.get(
+            response = self.session.get(
                 self.GEOCODING_URL,
                 params=params,
                 timeout=10
@@ -102,7 +198,7 @@ class PlacesAPIValidator:
             status = data.get("status", "")
             
             if status == "OK":
-                return ("valid", "Works with Geocoding API")
+                return ("valid", self.GEOCODING_OK_MESSAGE)
             elif status == "REQUEST_DENIED":
                 return ("invalid", data.get("error_message", "Request denied"))
             elif status == "OVER_QUERY_LIMIT":
@@ -113,26 +209,58 @@ class PlacesAPIValidator:
         except Exception as e:
             return ("error", f"Geocoding fallback failed: {str(e)}")
 
+    def _denial_hint(self, error_msg: Optional[str]) -> Optional[str]:
+        """Classify a REQUEST_DENIED message using DENIAL_HINTS."""
+        if not error_msg:
+            return None
+        
+        low = error_msg.lower()
+        for phrase, hint in self.DENIAL_HINTS:
+            if phrase in low:
+                return hint
+        return None
+
     def get_key_info(self, api_key: str) -> dict:
         """
-        Get detailed information about a valid API key.
+        Get detailed information about an API key.
         
-        Returns dict with available services and quota info.
+        The Geocoding API is only probed when the Places response leaves its
+        availability unclear (the Places API isn't enabled, or the denial
+        reason is unknown).
+        
+        Returns dict with available services and details of the Places check.
+        'geocoding_api' is None unless Geocoding was actually checked and gave
+        a conclusive answer (e.g. not when Places accepted the key directly,
+        or when a check was rate limited or failed).
         """
         info = {
             "places_api": False,
-            "geocoding_api": False,
+            "geocoding_api": None,
             "details": {}
         }
         
-        # Check Places API
-        status, _ = self.validate_key(api_key)
+        # Check Places API, keeping any Geocoding fallback result so the
+        # Geocoding check below doesn't repeat it
+        geocoding = None
+        places = self._check_places(api_key)
+        if places is None:
+            geocoding = self._try_geocoding(api_key)
+        status, error_msg = places or geocoding
+        hint = self._denial_hint(error_msg) if status in ("invalid", "restricted") else None
+        info["details"] = {
+            "status": status,
+            "error_message": error_msg,
+            "hint": hint,
+        }
+        
         if status == "valid":
             info["places_api"] = True
+        elif status in ("invalid", "restricted") and hint in (None, "api_not_enabled"):
+            # Check Geocoding API, unless the fallback above already did
+            geocoding = geocoding or self._try_geocoding(api_key)
         
-        # Check Geocoding API
-        status, _ = self._try_geocoding(api_key)
-        if status == "valid":
-            info["geocoding_api"] = True
+        # Only a conclusive Geocoding answer says whether it works
+        if geocoding is not None and geocoding[0] not in ("rate_limited", "error"):
+            info["geocoding_api"] = geocoding[0] == "valid"
         
         return info